@@ -7,6 +7,7 @@ import requests
 from report_generator import generate_orca_report
 from orca_alerts import ALL_ALERTS, BUSINESS_UNITS
 from file_generator import create_docx, create_pdf
+from report_history import ReportHistory
 
 # --- Page Configuration ---
 st.set_page_config(page_title="Orca Scribe", page_icon="🐳", layout="wide")
@@ -37,6 +38,10 @@ if "report" not in st.session_state:
     st.session_state.report = None
 if "report_data" not in st.session_state:
     st.session_state.report_data = {}
+if "report_history" not in st.session_state:
+    st.session_state.report_history = ReportHistory()
+if "report_id" not in st.session_state:
+    st.session_state.report_id = None
 
 # --- Main App UI ---
 st.markdown('<h1 class="main-title">Orca Scribe Intelligent Assistant</h1>', unsafe_allow_html=True)
@@ -86,12 +91,29 @@ with tab3:
             "url": st.session_state.url,
             "analyst_name": "Tejas Bhal (CONTRACTOR)"
         }
-        st.session_state.report_data = report_data
 
         final_report = generate_orca_report(report_data)
-        st.session_state.report = final_report
-        st.balloons()
-            
+        if final_report:
+            st.session_state.report = final_report
+            st.session_state.report_data = report_data
+            st.session_state.report_id = st.session_state.report_history.add(final_report, report_data)
+            st.balloons()
+
+    history = st.session_state.report_history
+    if len(history) > 1:
+        history_entries = history.entries()
+        history_labels = dict(history_entries)
+        history_ids = [entry_id for entry_id, _ in history_entries]
+        selected_id = st.selectbox(
+            "🕘 Report History",
+            options=history_ids,
+            index=history_ids.index(st.session_state.report_id) if st.session_state.report_id in history_ids else 0,
+            format_func=lambda entry_id: history_labels[entry_id],
+        )
+        if selected_id != st.session_state.report_id:
+            st.session_state.report, st.session_state.report_data = history.get(selected_id)
+            st.session_state.report_id = selected_id
+
     if st.session_state.report:
         st.markdown("---")
         st.subheader("📄 Report Preview")
@@ -99,8 +121,15 @@ with tab3:
         
         st.markdown("---")
         st.subheader("📥 Download Final Report")
+        report_id = st.session_state.report_id
+        if report_id in history:
+            docx_bytes = history.get_export(report_id, "docx", create_docx)
+            pdf_bytes = history.get_export(report_id, "pdf", create_pdf)
+        else:
+            docx_bytes = create_docx(st.session_state.report)
+            pdf_bytes = create_pdf(st.session_state.report)
         col1, col2 = st.columns(2)
         with col1:
-            st.download_button("Download as DOCX", create_docx(st.session_state.report), f"{st.session_state.report_data.get('alert_name', 'report')}.docx", use_container_width=True)
+            st.download_button("Download as DOCX", docx_bytes, f"{st.session_state.report_data.get('alert_name', 'report')}.docx", use_container_width=True)
         with col2:
-            st.download_button("Download as PDF", create_pdf(st.session_state.report), f"{st.session_state.report_data.get('alert_name', 'report')}.pdf", use_container_width=True)
\ No newline at end of file
+            st.download_button("Download as PDF", pdf_bytes, f"{st.session_state.report_data.get('alert_name', 'report')}.pdf", use_container_width=True)
\ No newline at end of file
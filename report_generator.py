@@ -34,9 +34,10 @@ def run_ai_stage(prompt):
         st.error(f"An AI stage failed: {e}")
         return None
 
-def generate_orca_report(report_data: dict) -> str:
+def generate_orca_report(report_data: dict) -> str | None:
     """
     Runs an advanced "Two-Pass" AI chain to generate a high-quality, bespoke report.
+    Returns None if either AI stage fails.
     """
     alert_name = report_data.get("alert_name", "Unknown Alert")
     verdict = report_data.get("verdict", "False Positive")
@@ -60,7 +61,9 @@ def generate_orca_report(report_data: dict) -> str:
     Generate the Markdown template now.
     """
     bespoke_template = run_ai_stage(template_generation_prompt)
-    if not bespoke_template: return "Report generation failed at Template Generation stage."
+    if not bespoke_template:
+        st.error("Report generation failed at the Template Generation stage.")
+        return None
 
     # --- Pass 2: The "Report Writer" ---
     st.info("Step 2: Writing the report using the custom template...")
@@ -87,7 +90,9 @@ def generate_orca_report(report_data: dict) -> str:
     Generate the final, populated report now.
     """
     final_report = run_ai_stage(report_writing_prompt)
-    if not final_report: return "Report generation failed at the Report Writing stage."
+    if not final_report:
+        st.error("Report generation failed at the Report Writing stage.")
+        return None
     
     st.success("AI analysis complete. Report finalized.")
     return final_report
\ No newline at end of file
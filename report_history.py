@@ -0,0 +1,96 @@
+# report_history.py
+
+import os
+import json
+import zlib
+from collections import OrderedDict
+from datetime import datetime
+
+# --- History Limits (per session) ---
+MIN_BYTES = 64 * 1024
+
+def _env_int(name: str, default: int, minimum: int) -> int:
+    """Reads an integer limit from the environment, falling back to the default on bad values."""
+    try:
+        value = int(os.getenv(name, default))
+    except ValueError:
+        value = default
+    return max(minimum, value)
+
+MAX_ENTRIES = _env_int("REPORT_HISTORY_MAX_ENTRIES", 20, 1)
+MAX_BYTES = _env_int("REPORT_HISTORY_MAX_BYTES", 2 * 1024 * 1024, MIN_BYTES)
+
+def _pack(data: bytes) -> bytes:
+    return zlib.compress(data, 6)
+
+def _unpack(blob: bytes) -> bytes:
+    return zlib.decompress(blob)
+
+class ReportHistory:
+    """
+    A bounded, LRU-ordered store of earlier report drafts for one session.
+    Reports and their input data are kept zlib-compressed; rendered exports are already compressed
+    formats (DOCX/PDF) and are kept as-is. All stored bytes count towards the byte budget,
+    and the least recently used drafts are evicted once the entry count or byte budget is exceeded.
+    """
+
+    def __init__(self, max_entries: int = MAX_ENTRIES, max_bytes: int = MAX_BYTES):
+        self.max_entries = max(1, max_entries)
+        self.max_bytes = max(MIN_BYTES, max_bytes)
+        self._entries = OrderedDict()
+        self._next_id = 1
+        self.total_bytes = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, entry_id):
+        return entry_id in self._entries
+
+    def add(self, report_text: str, report_data: dict) -> int:
+        """Stores a new draft and returns its entry id."""
+        entry_id = self._next_id
+        self._next_id += 1
+        entry = {
+            "label": f"#{entry_id} · {datetime.now().strftime('%H:%M:%S')} · {report_data.get('alert_name', 'report')}",
+            "report": _pack(report_text.encode("utf-8")),
+            "data": _pack(json.dumps(report_data).encode("utf-8")),
+            "exports": {},
+        }
+        entry["size"] = len(entry["report"]) + len(entry["data"])
+        self._entries[entry_id] = entry
+        self.total_bytes += entry["size"]
+        self._evict()
+        return entry_id
+
+    def get(self, entry_id: int):
+        """Returns (report_text, report_data) for an entry and marks it as recently used."""
+        entry = self._entries[entry_id]
+        self._entries.move_to_end(entry_id)
+        report_text = _unpack(entry["report"]).decode("utf-8")
+        report_data = json.loads(_unpack(entry["data"]).decode("utf-8"))
+        return report_text, report_data
+
+    def get_export(self, entry_id: int, fmt: str, render) -> bytes:
+        """Returns the rendered export for an entry, calling render(report_text) only on the first request."""
+        entry = self._entries[entry_id]
+        self._entries.move_to_end(entry_id)
+        rendered = entry["exports"].get(fmt)
+        if rendered is not None:
+            return rendered
+        rendered = render(_unpack(entry["report"]).decode("utf-8"))
+        entry["exports"][fmt] = rendered
+        entry["size"] += len(rendered)
+        self.total_bytes += len(rendered)
+        self._evict()
+        return rendered
+
+    def entries(self):
+        """Returns (entry_id, label) pairs, newest first."""
+        return sorted(((entry_id, entry["label"]) for entry_id, entry in self._entries.items()), reverse=True)
+
+    def _evict(self):
+        # The most recently used entry is never evicted, even if it alone exceeds the byte budget.
+        while len(self._entries) > 1 and (len(self._entries) > self.max_entries or self.total_bytes > self.max_bytes):
+            _, entry = self._entries.popitem(last=False)
+            self.total_bytes -= entry["size"]
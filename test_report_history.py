@@ -0,0 +1,85 @@
+# test_report_history.py
+
+import report_history
+from report_history import MIN_BYTES, ReportHistory
+
+EXPORT_SIZE = 40 * 1024
+
+def _render(report_text):
+    return b"x" * EXPORT_SIZE
+
+def test_get_round_trips_report_and_data():
+    history = ReportHistory()
+    entry_id = history.add("# Report", {"alert_name": "S3 bucket public"})
+    assert history.get(entry_id) == ("# Report", {"alert_name": "S3 bucket public"})
+
+def test_entry_limit_evicts_least_recently_used():
+    history = ReportHistory(max_entries=2)
+    first = history.add("first", {})
+    second = history.add("second", {})
+    history.get(first)
+    third = history.add("third", {})
+    assert first in history and third in history
+    assert second not in history
+
+def test_get_export_marks_entry_recently_used():
+    history = ReportHistory(max_entries=2)
+    first = history.add("first", {})
+    second = history.add("second", {})
+    history.get_export(first, "pdf", lambda report_text: b"pdf")
+    history.add("third", {})
+    assert first in history
+    assert second not in history
+
+def test_get_export_renders_once_and_stores_raw_bytes():
+    history = ReportHistory()
+    entry_id = history.add("# Report", {})
+    calls = []
+
+    def render(report_text):
+        calls.append(report_text)
+        return b"%PDF-1.4"
+
+    assert history.get_export(entry_id, "pdf", render) == b"%PDF-1.4"
+    assert history.get_export(entry_id, "pdf", render) == b"%PDF-1.4"
+    assert calls == ["# Report"]
+
+def test_export_bytes_count_towards_byte_budget():
+    history = ReportHistory(max_bytes=MIN_BYTES)
+    first = history.add("first", {})
+    second = history.add("second", {})
+    history.get_export(first, "docx", _render)
+    assert first in history and second in history
+    history.get_export(second, "docx", _render)
+    assert first not in history
+    assert second in history
+    assert history.total_bytes <= MIN_BYTES
+
+def test_most_recently_used_entry_is_never_evicted():
+    history = ReportHistory(max_bytes=MIN_BYTES)
+    entry_id = history.add("only", {})
+    history.get_export(entry_id, "docx", lambda report_text: b"x" * (2 * MIN_BYTES))
+    assert entry_id in history
+    assert len(history) == 1
+
+def test_total_bytes_tracks_evictions():
+    history = ReportHistory(max_entries=2)
+    ids = [history.add(f"report {i}", {"i": i}) for i in range(4)]
+    for entry_id in ids[-2:]:
+        history.get_export(entry_id, "pdf", _render)
+    expected = sum(entry["size"] for entry in history._entries.values())
+    assert history.total_bytes == expected
+    assert [entry_id for entry_id, _ in history.entries()] == ids[:-3:-1]
+
+def test_limits_are_clamped():
+    history = ReportHistory(max_entries=0, max_bytes=-1)
+    assert history.max_entries == 1
+    assert history.max_bytes == MIN_BYTES
+
+def test_env_limits_fall_back_on_bad_values(monkeypatch):
+    monkeypatch.setenv("REPORT_HISTORY_MAX_ENTRIES", "")
+    assert report_history._env_int("REPORT_HISTORY_MAX_ENTRIES", 20, 1) == 20
+    monkeypatch.setenv("REPORT_HISTORY_MAX_ENTRIES", "lots")
+    assert report_history._env_int("REPORT_HISTORY_MAX_ENTRIES", 20, 1) == 20
+    monkeypatch.setenv("REPORT_HISTORY_MAX_ENTRIES", "-5")
+    assert report_history._env_int("REPORT_HISTORY_MAX_ENTRIES", 20, 1) == 1